@@ -1,7 +1,13 @@
+import gc
+import weakref
+
 import pytest
 
+from timelength.dataclasses import ParsedTimeLength
+from timelength.errors import LocaleConfigError
 from timelength.locales import English
 from timelength.timelength import TimeLength
+from timelength.utils import _strip_combining, remove_diacritics
 
 
 @pytest.fixture
@@ -17,3 +23,120 @@ def test_parsedtimelength_reset(tl_notstrict):
     tl_notstrict.parse()
     second_seconds = tl_notstrict.result.seconds
     assert first_seconds != second_seconds
+
+
+def test_conversions():
+    tl = TimeLength("1 day 2 hours", locale = English())
+    assert tl.to_milliseconds() == 93600000.0
+    assert tl.to_seconds() == 93600.0
+    assert tl.to_minutes() == 1560.0
+    assert tl.to_hours() == 26.0
+    assert tl.to_days(max_precision = 3) == 1.083
+    assert tl.to_weeks(max_precision = 4) == 0.1548
+
+
+def test_parse_cache():
+    first = TimeLength("5 minutes 3 apples", locale = English())
+    second = TimeLength("5 minutes 3 apples", locale = first.locale)
+    assert first.result == second.result
+    assert first.result.valid is not second.result.valid
+    second.result.invalid.clear()
+    assert TimeLength("5 minutes 3 apples", locale = first.locale).result.invalid == first.result.invalid
+    TimeLength.clear_cache()
+    assert TimeLength("5 minutes 3 apples", locale = first.locale).result == first.result
+
+
+def test_parse_cache_releases_locale():
+    locale = English()
+    locale_ref = weakref.ref(locale)
+    assert TimeLength("5 minutes", locale = locale).to_seconds() == 300.0
+    del locale
+    gc.collect()
+    assert locale_ref() is None
+
+
+def test_parse_unchanged(tl_notstrict):
+    result = tl_notstrict.result
+    tl_notstrict.parse()
+    assert tl_notstrict.result is result
+    tl_notstrict.content = "apples"
+    tl_notstrict.parse()
+    assert tl_notstrict.result is result
+    assert tl_notstrict.result.success is False
+    assert tl_notstrict.result.valid == []
+
+
+def test_parse_after_clear_cache():
+    tl = TimeLength("5 minutes", locale = English())
+    assert tl.to_seconds() == 300.0
+    tl.locale._minute.scale = 120
+    TimeLength.clear_cache()
+    tl.parse()
+    assert tl.to_seconds() == 600.0
+    assert tl.to_minutes() == 5.0
+
+
+def test_parse_after_terms_modified():
+    locale = English()
+    locale._minute.terms.append("mnx")
+    assert not TimeLength("5 mnx", locale = locale).result.success
+    TimeLength.clear_cache()
+    assert TimeLength("5 mnx", locale = locale).to_seconds() == 300.0
+
+
+def test_parse_after_result_assigned(tl_notstrict):
+    tl_notstrict.result = ParsedTimeLength()
+    tl_notstrict.parse()
+    assert tl_notstrict.result.success
+    assert tl_notstrict.to_seconds() == 0.0
+
+
+def test_parse_after_result_shared():
+    first = TimeLength("1 hour", locale = English())
+    second = TimeLength("5 minutes", locale = first.locale)
+    second.result = first.result
+    second.parse()
+    assert second.to_seconds() == 300.0
+    assert first.to_seconds() == 3600.0
+    assert second.result is not first.result
+
+
+def test_weakref(tl_notstrict):
+    assert weakref.ref(tl_notstrict)() is tl_notstrict
+
+
+def test_lazy_parse():
+    tl = TimeLength("3 minutes", locale = English(), lazy = True)
+    assert tl._result is None
+    assert tl.to_seconds() == 180.0
+    assert tl.result.success is True
+
+
+def test_default_locale():
+    first = TimeLength("5 seconds")
+    second = TimeLength("5 seconds", locale = None)
+    assert isinstance(first.locale, English)
+    assert first.locale is second.locale
+
+
+def test_missing_parser():
+    locale = English()
+    locale._parser = None
+    with pytest.raises(LocaleConfigError):
+        TimeLength("5 seconds", locale = locale)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("ἡμέρα", "ημερα"),  # Greek, through the table.
+        ("йод", "иод"),  # Cyrillic, through the table.
+        ("क़", "क"),  # Devanagari, through the table.
+        ("e\u0301\u0308", "e"),  # Combining marks, mapped to "" by the table.
+        ("½ día", "1\u20442 dia"),  # Multi-character decomposition, through the table.
+        ("ｈｏｒａ día", "hora dia"),  # Fullwidth, past the table through `_strip_combining`.
+    ],
+)
+def test_remove_diacritics(text, expected):
+    assert remove_diacritics(text) == expected
+    assert remove_diacritics(text) == _strip_combining(text)
@@ -15,6 +15,7 @@ class ParsedTimeLength:
 
     ### Methods
     
+    - `reset`: Restore the default values in place, emptying the existing `invalid` and `valid` lists.
     - `__str__`: Return a string indicating the success or failure of the parsing.
     - `__repr__`: Return a string representation of the `ParsedTimeLength` with attributes included.
     """
@@ -24,6 +25,13 @@ class ParsedTimeLength:
     invalid: list = field(default_factory = list)
     valid: list = field(default_factory = list)
 
+    def reset(self):
+        """Restore the default values in place, emptying the existing `invalid` and `valid` lists."""
+        self.success = False
+        self.seconds = 0.0
+        self.invalid.clear()
+        self.valid.clear()
+
     def __str__(self):
         """Return a string indicating the success or failure of the parsing."""
         return "Success" if self.success else "Failure"
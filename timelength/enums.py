@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class CharacterType(Enum):
@@ -56,3 +56,24 @@ class NumeralType(Enum):
     THOUSAND = "THOUSAND"
     MODIFIER = "MODIFIER"
     MULTIPLIER = "MULTIPLIER"
+
+
+class Unit(IntEnum):
+    """
+    Enumerates the default units of time, indexing into `Locale._scale_array`.
+
+    ### Members
+    - `MILLISECOND`, `SECOND`, `MINUTE`, `HOUR`, `DAY`, `WEEK`, `MONTH`, `YEAR`, `DECADE`, `CENTURY`:
+        Represent their respective default `Scale`s, in ascending order.
+    """
+
+    MILLISECOND = 0
+    SECOND = 1
+    MINUTE = 2
+    HOUR = 3
+    DAY = 4
+    WEEK = 5
+    MONTH = 6
+    YEAR = 7
+    DECADE = 8
+    CENTURY = 9
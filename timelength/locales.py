@@ -1,10 +1,16 @@
 import json
 import os
+import weakref
 from importlib import util
 from typing import Union
 
 from timelength.dataclasses import Scale
+from timelength.enums import BufferType
 from timelength.errors import LocaleConfigError
+from timelength.utils import is_float
+
+# Every live `Locale`, so `TimeLength.clear_cache` can rebuild their lookup tables.
+_locales = weakref.WeakSet()
 
 
 class Locale:
@@ -120,6 +126,8 @@ class Locale:
             self._decade,
             self._century,
         ]
+        # The default Scales indexed by `Unit`, so the `TimeLength` conversion methods need one list lookup.
+        self._scale_array: list = self._scales[:10]
 
         # Allow for custom defined Scales.
         for scale_name in scales_json:
@@ -142,21 +150,51 @@ class Locale:
         self._numerals = self._get_config_or_raise("numerals")
         self._extra_data = self._get_config_or_raise("extra_data")
 
+        self._build_lookups()
+        _locales.add(self)
+
+    def _build_lookups(self):
+        """Build the lookup tables used while parsing from the `Locale`'s current terms and separators.
+
+        Run again by `TimeLength.clear_cache` so that terms modified in place are picked up.
+        """
+        # Precomputed for the per-character membership checks done while parsing.
+        self._number_separators = frozenset(
+            self._decimal_separators + self._thousand_separators
+        )
+        self._standalone_terms = frozenset(
+            self._connectors + self._segmentors + self._allowed_terms
+        ).union(self._number_separators)
+
+        # Map each term to the first Scale and numeral listing it, matching the old linear lookups.
+        self._scales_by_term: dict = {}
+        for scale in self._scales:
+            for term in scale.terms:
+                self._scales_by_term.setdefault(term, scale)
+        self._numerals_by_term: dict = {}
+        for numeral in self._numerals.values():
+            for term in numeral.get("terms", []):
+                self._numerals_by_term.setdefault(term, numeral)
+
+        # Classify every known term once for `buffer_type`. Later updates win, giving scales precedence over
+        # numerals over symbols, and numbers are left out as they always classify as `BufferType.NUMBER`.
+        self._buffer_types: dict = {}
+        for terms, term_type in (
+            (self._connectors + self._segmentors + self._allowed_terms, BufferType.SPECIAL),
+            (self._numerals_by_term, BufferType.NUMERAL),
+            (self._scales_by_term, BufferType.SCALE),
+        ):
+            self._buffer_types.update(
+                (term, term_type) for term in terms if not is_float(term)
+            )
+
     def _get_scale(self, text: str) -> Scale:
         """Get the scale that contains a specific value in its terms list."""
-        for scale in self._scales:
-            scale: Scale
-            if text in scale.terms:
-                return scale
-        return None
+        return self._scales_by_term.get(text)
 
     def _get_numeral(self, text: str) -> dict:
         """Get a numeral that contains a specific value in its terms list."""
-        numeral = {}
-        for numeral in self._numerals:
-            if text in self._numerals[numeral]["terms"]:
-                return self._numerals[numeral]
-        return None
+        return self._numerals_by_term.get(text)
 
     def _load_parser(self, base_dir):
         """Load the parser file linked in the config file into a method attached to the `Locale`."""
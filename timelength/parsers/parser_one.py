@@ -24,19 +24,7 @@ def parser_one(
     def save_buffer():
         nonlocal buffer
         if buffer:
-            numerals = locale._numerals
-            scales = locale._scales
-            buffer_alphanum = buffer_type(
-                buffer,
-                [term for scale in scales for term in scale.terms],
-                [
-                    term
-                    for numeral in numerals
-                    if "terms" in numerals[numeral]
-                    for term in numerals[numeral]["terms"]
-                ],
-                locale._connectors + locale._segmentors + locale._allowed_terms,
-            )
+            buffer_alphanum = buffer_type(buffer, locale._buffer_types)
 
             numeral_type = None
             if buffer_alphanum is BufferType.NUMERAL:
@@ -64,8 +52,7 @@ def parser_one(
         if target_chartype == CharacterType.NUMBER:
             while next_index < len(content) and (
                 character_type(content[next_index]) == target_chartype
-                or content[next_index]
-                in locale._decimal_separators + locale._thousand_separators
+                or content[next_index] in locale._number_separators
             ):
                 if skip_thousand:
                     skip_thousand -= 1
@@ -159,12 +146,7 @@ def parser_one(
             check_next(index + 1, CharacterType.ALPHABET)
         elif (
             current_alphanum == CharacterType.SPECIAL
-            and char
-            not in locale._connectors
-            + locale._segmentors
-            + locale._allowed_terms
-            + locale._decimal_separators
-            + locale._thousand_separators
+            and char not in locale._standalone_terms
         ):
             buffer += char
             check_next(index + 1, CharacterType.SPECIAL)
@@ -1,8 +1,52 @@
+import itertools
 import typing
+import weakref
+from functools import lru_cache
 
 from timelength.dataclasses import ParsedTimeLength
+from timelength.enums import Unit
 from timelength.errors import DisabledScale, LocaleConfigError
-from timelength.locales import English, Locale
+from timelength.locales import English, Locale, _locales
+
+# Longer content is parsed without the cache so one-off strings don't occupy it.
+_CACHEABLE_LENGTH = 128
+
+# Bumped by `TimeLength.clear_cache` so existing instances don't skip re-parsing after it's called.
+_cache_generation = 0
+
+# Cache keys stand in for `Locale`s so the cache holds no `Locale` alive. Unlike `id`, a key is never
+# reused, so entries left behind by a collected `Locale` can't be hit and simply age out of the cache.
+_locale_keys = weakref.WeakKeyDictionary()
+_locales_by_key = weakref.WeakValueDictionary()
+_next_locale_key = itertools.count()
+
+
+def _locale_key(locale: Locale) -> int:
+    """Return the cache key of the passed `Locale`, assigning a new one on first use."""
+    key = _locale_keys.get(locale)
+    if key is None:
+        key = _locale_keys[locale] = next(_next_locale_key)
+        _locales_by_key[key] = locale
+    return key
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(content: str, strict: bool, locale_key: int) -> tuple:
+    """Run the parser of the `Locale` behind `locale_key` and return the fields of the resulting
+    `ParsedTimeLength` as a tuple.
+
+    A `Locale` modified in place requires `TimeLength.clear_cache`.
+    """
+    locale = _locales_by_key[locale_key]
+    result = ParsedTimeLength()
+    locale._parser(content, strict, locale, result)
+    return result.success, result.seconds, tuple(result.invalid), tuple(result.valid)
+
+
+@lru_cache(maxsize=None)
+def _default_locale() -> Locale:
+    """Return the shared `English` `Locale` used when no `Locale` is passed, creating it on first use."""
+    return English()
 
 
 class TimeLength:
@@ -19,11 +63,19 @@ class TimeLength:
     - `locale` (`Locale`): The locale context used for parsing the time string. Defaults to `English`.
     - `result` (`ParsedTimeLength`): The result of the parsing.
 
+    ### Initialization Arguments
+
+    - `content`, `strict`, `locale`: Set the attributes of the same names.
+    - `lazy` (`bool`): If `True`, then parsing is deferred until `result` is first accessed instead of
+        happening during initialization. Defaults to `False`. Not stored on the `TimeLength`.
+
     ### Methods
 
     - `parse`: Parse the `content` attribute based on the `strict` and `locale` attributes.
-        Automatically called during initialization. Manually call this method again if changes
-        are made to `content`, `strict`, or `locale`.
+        Automatically called during initialization, or on first access of `result` if `lazy`. Manually
+        call this method again if changes are made to `content`, `strict`, or `locale`.
+    - `clear_cache`: Clear the cache of parsed results shared by all `TimeLength`s and rebuild the
+        lookup tables of every `Locale`. Call this after modifying a `Locale` in place.
     - `to_milliseconds`, `to_seconds`, `to_minutes`, `to_hours`, `to_days`, `to_weeks`, `to_months`,
         `to_years`, `to_decades`, `to_centuries`: Convert the total duration to the respective
         units of each method with specified precision.
@@ -39,15 +91,35 @@ class TimeLength:
     ```
     """
 
+    __slots__ = ("content", "strict", "locale", "_result", "_parse_signature", "__weakref__")
+
     def __init__(
-        self, content: str = "", strict: bool = False, locale: Locale = English()
+        self,
+        content: str = "",
+        strict: bool = False,
+        locale: typing.Optional[Locale] = None,
+        lazy: bool = False,
     ) -> None:
-        """Initialize the `TimeLength` based on passed settings and call the `parse` method."""
+        """Initialize the `TimeLength` based on passed settings and call the `parse` method unless `lazy`."""
         self.content = content
         self.strict = strict
-        self.locale = locale
-        self.result = ParsedTimeLength()
-        self.parse()
+        self.locale = locale if locale is not None else _default_locale()
+        self._result = None
+        self._parse_signature = None
+        if not lazy:
+            self.parse()
+
+    @property
+    def result(self) -> ParsedTimeLength:
+        """The result of the parsing, parsing first if that has not happened yet."""
+        if self._result is None:
+            self.parse()
+        return self._result
+
+    @result.setter
+    def result(self, value: ParsedTimeLength) -> None:
+        self._result = value
+        self._parse_signature = None
 
     def __str__(self) -> str:
         """Return the valid parsed lengths of time."""
@@ -58,19 +130,52 @@ class TimeLength:
         return f'TimeLength("{self.content}", {self.strict}, {self.locale})'
 
     def parse(self) -> None:
-        """Parse the passed content using the parser attached to the `TimeLength`'s `Locale`."""
-        if (
-            hasattr(self.locale, "_parser")
-            and self.locale._parser
-            and callable(self.locale._parser)
-        ):
-            self.result = ParsedTimeLength()
-            self.locale._parser(self.content.strip(), self.strict, self.locale, self.result)
-        else:
+        """Parse the passed content using the parser attached to the `TimeLength`'s `Locale`.
+
+        Does nothing if `content`, `strict`, and `locale` are unchanged since the last parse and
+        `clear_cache` has not been called since. Otherwise a `result` from a previous parse is reset and
+        refilled in place, while an assigned `result` is replaced.
+        """
+        if not callable(getattr(self.locale, "_parser", None)):
             raise LocaleConfigError(
                 f"Parser function not found attached to {self.locale}."
             ) from None
 
+        signature = (self.content, self.strict, self.locale, _cache_generation)
+        if signature == self._parse_signature:
+            return
+        content = self.content.strip()
+        parser = (
+            _parse_cached
+            if len(content) <= _CACHEABLE_LENGTH
+            else _parse_cached.__wrapped__
+        )
+        success, seconds, invalid, valid = parser(
+            content, self.strict, _locale_key(self.locale)
+        )
+        # Only a result this instance filled itself is reused, never one assigned from elsewhere.
+        if self._parse_signature is None:
+            self._result = ParsedTimeLength()
+        else:
+            self._result.reset()
+        self._result.success = success
+        self._result.seconds = seconds
+        self._result.invalid.extend(invalid)
+        self._result.valid.extend(valid)
+        self._parse_signature = signature
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of parsed results. Call this if a `Locale` in use is modified in place.
+
+        Also rebuilds the term and separator lookup tables of every `Locale` so in place changes apply.
+        """
+        global _cache_generation
+        for locale in list(_locales):
+            locale._build_lookups()
+        _parse_cached.cache_clear()
+        _cache_generation += 1
+
     def to_milliseconds(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to milliseconds.
 
@@ -81,9 +186,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(
-            self.result.seconds, self.locale._millisecond.scale, max_precision
-        )
+        return self._round(Unit.MILLISECOND, max_precision)
 
     def to_seconds(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to seconds.
@@ -95,9 +198,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(
-            self.result.seconds, self.locale._second.scale, max_precision
-        )
+        return self._round(Unit.SECOND, max_precision)
 
     def to_minutes(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to minutes.
@@ -109,9 +210,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(
-            self.result.seconds, self.locale._minute.scale, max_precision
-        )
+        return self._round(Unit.MINUTE, max_precision)
 
     def to_hours(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to hours.
@@ -123,7 +222,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(self.result.seconds, self.locale._hour.scale, max_precision)
+        return self._round(Unit.HOUR, max_precision)
 
     def to_days(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to days.
@@ -135,7 +234,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(self.result.seconds, self.locale._day.scale, max_precision)
+        return self._round(Unit.DAY, max_precision)
 
     def to_weeks(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to weeks.
@@ -147,7 +246,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(self.result.seconds, self.locale._week.scale, max_precision)
+        return self._round(Unit.WEEK, max_precision)
 
     def to_months(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to months.
@@ -159,7 +258,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(self.result.seconds, self.locale._month.scale, max_precision)
+        return self._round(Unit.MONTH, max_precision)
 
     def to_years(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to years.
@@ -171,7 +270,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(self.result.seconds, self.locale._year.scale, max_precision)
+        return self._round(Unit.YEAR, max_precision)
 
     def to_decades(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to decades.
@@ -183,9 +282,7 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(
-            self.result.seconds, self.locale._decade.scale, max_precision
-        )
+        return self._round(Unit.DECADE, max_precision)
 
     def to_centuries(self, max_precision=2) -> typing.Union[int, float]:
         """Convert the total seconds to centuries.
@@ -197,16 +294,14 @@ class TimeLength:
         ### Returns:
         - `Union[int, float]` number of this method's units.
         """
-        return self._round(
-            self.result.seconds, self.locale._century.scale, max_precision
-        )
+        return self._round(Unit.CENTURY, max_precision)
 
-    def _round(
-        self, total_seconds: float, scale: float, max_precision: int
-    ) -> typing.Union[int, float]:
-        """Round the conversion methods while checking for disabled `Scale`s."""
+    def _round(self, unit: Unit, max_precision: int) -> typing.Union[int, float]:
+        """Convert the total seconds to `unit` and round them, raising `DisabledScale` if it is disabled."""
         try:
-            return round(total_seconds / scale, max_precision)
+            return round(
+                self.result.seconds / self.locale._scale_array[unit].scale, max_precision
+            )
         except ZeroDivisionError as e:
             raise DisabledScale(
                 "That Scale has been disabled by being removed from the config."
@@ -1,10 +1,20 @@
+import re
 import unicodedata
+from functools import lru_cache
 
 from timelength.enums import BufferType, CharacterType
 
 
+# Besides decimal digits and whitespace, the only characters a string accepted by `float` may start with.
+_FLOAT_STARTS = frozenset("+-.iInN")
+
+
 def is_float(num: str) -> bool:
     """Check if the passed string is a number."""
+    if not num or not (
+        num[0] in _FLOAT_STARTS or num[0].isdecimal() or num[0].isspace()
+    ):
+        return False
     try:
         float(num)
         return True
@@ -12,6 +22,7 @@ def is_float(num: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1024)
 def character_type(text: str) -> CharacterType:
     """Check the type of the passed character based on the `CharacterType` enum."""
     if is_float(text):
@@ -22,21 +33,42 @@ def character_type(text: str) -> CharacterType:
         return CharacterType.SPECIAL
 
 
-def buffer_type(text: str, scales: list, numerals: list, symbols: list) -> BufferType:
-    """Check the type of the passed string based on the `BufferType` enum."""
-    if is_float(text):
+def buffer_type(text: str, buffer_types: dict) -> BufferType:
+    """Check the type of the passed string based on the `BufferType` enum and a `Locale`'s known terms."""
+    known_type = buffer_types.get(text)
+    if known_type is not None:
+        return known_type
+    elif is_float(text):
         return BufferType.NUMBER
-    elif text in scales:
-        return BufferType.SCALE
-    elif text in numerals:
-        return BufferType.NUMERAL
-    elif text in symbols:
-        return BufferType.SPECIAL
     else:
         return BufferType.UNKNOWN
 
 
-def remove_diacritics(text: str) -> str:
-    """Replace accented and special characters with their normalized equivalents."""
+def _strip_combining(text: str) -> str:
+    """Apply NFKD normalization and drop the combining characters left behind."""
     nfkd_form = unicodedata.normalize("NFKD", text)
     return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+
+
+# Per-character results of `_strip_combining` for every code point below U+3000 (Latin, Greek, Cyrillic,
+# Indic scripts, combining marks, Latin/Greek Extended, punctuation and symbols), indexed by code point.
+# NFKD only reorders combining characters and those are all dropped, so translating one character at a
+# time matches normalizing the whole string. Already-decomposed characters skip the normalization.
+_DIACRITICS_TABLE = [
+    (
+        char
+        if unicodedata.is_normalized("NFKD", char) and not unicodedata.combining(char)
+        else _strip_combining(char)
+    )
+    for char in map(chr, range(0x3000))
+]
+_OUTSIDE_TABLE_RE = re.compile("[^\x00-\u2fff]")
+
+
+def remove_diacritics(text: str) -> str:
+    """Replace accented and special characters with their normalized equivalents."""
+    if text.isascii():
+        return text
+    if _OUTSIDE_TABLE_RE.search(text) is None:
+        return text.translate(_DIACRITICS_TABLE)
+    return _strip_combining(text)